@@ -3,6 +3,9 @@ from typing import List
 
 import vocab
 
+# Characters allowed in a mnemonic phrase: lowercase latin letters and the space separator.
+_PHRASE_CHARACTERS = frozenset(" abcdefghijklmnopqrstuvwxyz")
+
 
 class AppError(Exception):
     def __init__(self, message: str):
@@ -52,16 +55,14 @@ def bip39_encode(entropy: bytes) -> str:
         int.from_bytes(entropy, byteorder="big") << num_bits_checksum
     ) | checksum
 
-    # Convert each 11 bit chunk into a word.
+    # Convert each 11 bit chunk into a word. As the conversion starts with the rightmost bits of
+    # `entropy_and_checksum`, the words are written into a preallocated list from the end towards the beginning.
     remaining_data = entropy_and_checksum
-    words: List[str] = []
-    for _ in range(num_words):
-        words.append(vocab.mnemonic[remaining_data & 0b111_1111_1111])
+    words: List[str] = [""] * num_words
+    for k in range(num_words - 1, -1, -1):
+        words[k] = vocab.mnemonic[remaining_data & 0b111_1111_1111]
         remaining_data >>= 11
 
-    # As we started with the conversion progress with the rightmost bits of `entropy_and_checksum` the list of words
-    # needs to be reversed before we can join and return the final mnemonic phrase.
-    words.reverse()
     return " ".join(words)
 
 
@@ -70,7 +71,7 @@ def bip39_decode(phrase: str) -> bytes:
     `DecodingError` is raised in case the mnemonic is invalid. This implementation only covers the English BIP39
     wordlist as other wordlist are often poorly supported by other software and hardware devices.
     """
-    if not all(c in " abcdefghijklmnopqrstuvwxyz" for c in phrase):
+    if not _PHRASE_CHARACTERS.issuperset(phrase):
         raise DecodingError(
             f"Invalid mnemonic phrase {repr(phrase)} provided, phrase contains an invalid character."
         )
@@ -79,15 +80,16 @@ def bip39_decode(phrase: str) -> bytes:
     num_bits_entropy = get_entropy_bits(len(words))
     num_bits_checksum = num_bits_entropy // 32
 
+    try:
+        indexes = [vocab.mnemonic_dict[word] for word in words]
+    except KeyError as e:
+        raise DecodingError(
+            f"Invalid mnemonic phrase {repr(phrase)} provided, word '{e.args[0]}' is not in the BIP39 wordlist."
+        )
+
     bits = 0
-    for word in words:
-        bits <<= 11
-        try:
-            bits |= vocab.mnemonic_dict[word]
-        except KeyError:
-            raise DecodingError(
-                f"Invalid mnemonic phrase {repr(phrase)} provided, word '{word}' is not in the BIP39 wordlist."
-            )
+    for index in indexes:
+        bits = (bits << 11) | index
 
     checksum = bits & (2 ** num_bits_checksum - 1)
     bits >>= num_bits_checksum
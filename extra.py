@@ -29,6 +29,7 @@ def print_nbits(upto: int):
         print(f'with {i} words entropy_len is between {entropy_len} and {entropy_len2}')
 
 
-print_nbits(40)
+if __name__ == '__main__':
+    print_nbits(40)
 
 
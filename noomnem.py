@@ -22,6 +22,8 @@
 
 
 import vocab
+import bisect
+import functools
 import hashlib  # sha256, used only for checksum
 
 
@@ -36,7 +38,7 @@ bigint = int
 # mathematical notation for this kind of function is capital C with subscript n and superscript m.
 # the formula is: C(n, m) = n! / ((n - m)! * m!) where x! is factorial of x.
 # this is a pure function meaning result of the function is dependent only of arguments. this makes possible
-# to precalc all data (and store it in a table) before first use (not implemented).
+# to precalc all data (and store it in a table) before first use - see COMBI_TABLE below.
 def combi(n: int, m: int) -> bigint:
     assert n > 0 and m >= 0
     assert m <= n <= 2048
@@ -55,9 +57,52 @@ assert combi(5, 2) == 10
 assert combi(10, 3) == 120
 
 
+# precalculated values of combi for every n up to 2048 (vocabulary size) and every m up to 37 (longest mnemonic).
+# table is filled using Pascal's triangle: C(n, m) = C(n-1, m-1) + C(n-1, m), so no multiplications are needed.
+# COMBI_TABLE[n][m] is the same as combi2(n, m); values for n < m are zeros.
+# when porting to other language this table takes about 2049 * 38 bigints (each up to 264 bits).
+COMBI_MAX_N = 2048
+COMBI_MAX_M = 37
+COMBI_TABLE = [[1] + [0] * COMBI_MAX_M]
+for _n in range(1, COMBI_MAX_N + 1):
+    _prev = COMBI_TABLE[-1]
+    COMBI_TABLE.append([1] + [_prev[_m - 1] + _prev[_m] for _m in range(1, COMBI_MAX_M + 1)])
+del _n, _prev
+
+# same values grouped by m: COMBI_COLUMNS[m][n] == COMBI_TABLE[n][m]. for a fixed m values grow with n, so a column
+# is a sorted list and can be searched with bisect. ints are shared with COMBI_TABLE, only references are duplicated.
+COMBI_COLUMNS = [[row[_m] for row in COMBI_TABLE] for _m in range(COMBI_MAX_M + 1)]
+
+
+
+# returns column of combi values for given m: combi_column(m)[n] == combi2(n, m) for n from 0 to 2048.
+# for m up to 37 this is a precalculated column; longer columns are calculated on first use (with the recurrence
+# C(n, m) = C(n-1, m) * n / (n - m)) and cached, so hot paths can use columns for any m.
+@functools.lru_cache(maxsize=None)
+def combi_column(m: int) -> list[bigint]:
+    if m <= COMBI_MAX_M:
+        return COMBI_COLUMNS[m]
+    column = [0] * (COMBI_MAX_N + 1)
+    if m <= COMBI_MAX_N:
+        column[m] = value = 1
+        for n in range(m + 1, COMBI_MAX_N + 1):
+            value = value * n // (n - m)
+            column[n] = value
+    return column
+
+
+assert COMBI_TABLE[5][2] == combi(5, 2)
+assert COMBI_TABLE[2048][37] == combi(2048, 37)
+assert COMBI_TABLE[3][4] == 0
+assert combi_column(40)[100] == combi(100, 40)
+assert combi_column(40)[39] == 0
+
+
 def combi2(n: int, m: int) -> bigint:
     if n < m:
         return 0
+    if n <= COMBI_MAX_N and m <= COMBI_MAX_M:
+        return COMBI_TABLE[n][m]
     return combi(n, m)
 
 
@@ -65,15 +110,9 @@ def combi2(n: int, m: int) -> bigint:
 # logarithm answers the following question: to what exponent we need to raise base (in this case 2) to get the value.
 # log2(4) == 2 as we need to use exponent 2 for the base 2 to obtain 4.
 # log2(8) == 3 because 2 to the power of 3 equals 8.
+# bit_length() is the number of bits needed to store the value, so for positive n it is log2(n) + 1.
 def log2(n: bigint) -> int:
-    result = 0
-    while n >= 256:
-        n >>= 8
-        result += 8
-    while n > 1:
-        n //= 2
-        result += 1
-    return result
+    return n.bit_length() - 1 if n > 0 else 0
 
 
 # some inline tests
@@ -83,17 +122,15 @@ assert log2(7) == 2
 assert log2(6) == 2
 assert log2(5) == 2
 assert log2(4) == 2
+assert log2(1) == 0
+assert log2(0) == 0
 
 
 # returns upper bound value for logarithm of n with respect to base 2.
 # upper bound means that for values between 4 and 8 we get the answer 3, hence upper bound.
+# for n > 1 the number of bits needed to store n - 1 is exactly the upper bound.
 def log2upper(n: int):
-    result = 0
-    while n > 1:
-        n += 1
-        n //= 2
-        result += 1
-    return result
+    return (n - 1).bit_length() if n > 1 else 0
 
 
 assert log2upper(2048) == 11
@@ -102,40 +139,55 @@ assert log2upper(7) == 3
 assert log2upper(6) == 3
 assert log2upper(5) == 3
 assert log2upper(4) == 2
+assert log2upper(1) == 0
 
 
 # encodes entropy (value parameter) into list of sorted ints. m defines number of elements in a pick.
 # we don't need to know n for this scheme. what is scheme23? see a comment in scheme14.py
 def scheme23_encode_ints(value: bigint, m: int) -> list[int]:
-    result = []
-    for i in range(m, 0, -1):
-        cur = i
-        test = combi2(cur, i)
-        while test <= value:
-            cur += 1
-            test = combi2(cur, i)
-
-        cur -= 1
-        result.append(cur)
-        value -= combi2(cur, i)
-    return result[::-1]
+    columns = COMBI_COLUMNS if m <= COMBI_MAX_M else [combi_column(i) for i in range(m + 1)]
+    # larger values can't be encoded with picks from 2048 elements; without this check the search returns 2048
+    if value >= columns[m][COMBI_MAX_N]:
+        raise ValueError('value is too large to encode with ' + str(m) + ' elements')
+    result = [0] * m
+    # elements are found from the largest to the smallest, each one is strictly less than the previous one.
+    # C(i - 1, i) is zero so element i - 1 is always a candidate. search is narrowed to [i - 1, upper).
+    upper = COMBI_MAX_N + 1
+    for i in range(m, 1, -1):
+        # find the largest cur such that C(cur, i) <= value
+        column = columns[i]
+        cur = bisect.bisect_right(column, value, i - 1, upper) - 1
+        upper = cur
+        result[i - 1] = cur
+        value -= column[cur]
+    # for last element we don't need a search: C(cur, 1) == cur, so the element is the remaining value itself
+    if m:
+        result[0] = value
+    return result
 
 
 # decodes given list of sorted ints into entropy value. scheme 23 is used. elems must be already sorted.
 # why named scheme23? see a comment in scheme14.py
+# result is the sum of C(elems[k-1], k) for k from 1 to len(elems).
 def scheme23_decode_ints(elems: list[int]) -> bigint:
-    count = len(elems)
+    if len(elems) > COMBI_MAX_M:  # too long for COMBI_TABLE rows
+        return sum(combi_column(count)[elem] for count, elem in enumerate(elems, 1))
+    table = COMBI_TABLE
     result = 0
-    while count > 0:
-        result += combi2(elems[count-1], count)
-        count -= 1
+    for count, elem in enumerate(elems, 1):
+        result += table[elem][count]
     return result
 
 
 # returns number of words (from the standard 2048 words vocabulary) enough to derive given number of bits of entropy.
+# result depends only on desired_entropy, so it is cached.
+@functools.lru_cache(maxsize=None)
 def calc_nwords(desired_entropy: int):
+    # C(2048, i) is derived from C(2048, i-1) with C(n, i) = C(n, i-1) * (n - i + 1) / i, no need to call combi.
+    c = 1
     for i in range(1, 1024):
-        entropy = log2(combi(2048, i))
+        c = c * (2048 - i + 1) // i
+        entropy = log2(c)
         if entropy >= desired_entropy:
             return i
     return None
@@ -155,13 +207,13 @@ CHECKSUM_LENGTHS = {16: 3, 26: 5, 37: 7}
 SUPPORTED_LENGTHS_REVERSED = {v: k for k, v in SUPPORTED_LENGTHS.items()}
 
 
-def _calc_checksum(data_without_checksum: bigint, len_words: int) -> int:
-    data_len = SUPPORTED_LENGTHS[len_words] // 8
-    data_bytes = data_without_checksum.to_bytes(data_len, 'big')
+# checksum is calculated over the data bytes (without checksum).
+def _calc_checksum(data_bytes: bytes, len_words: int) -> int:
+    # checksum is the lowest bits of the hash (as a big-endian number). checksum has at most 7 bits, so it is enough
+    # to take the last byte of the hash instead of converting the whole hash to int.
     hash = hashlib.sha256(data_bytes).digest()
-    hashint = int.from_bytes(hash, 'big')
     mask = (1 << CHECKSUM_LENGTHS[len_words]) - 1
-    return hashint & mask
+    return hash[-1] & mask
 
 
 # splits data into two components: data_without_checksum and checksum.
@@ -173,8 +225,9 @@ def _extract_checksum(data: bigint, len_words: int) -> (bigint, int):
     return data_without_checksum, data & mask
 
 
-def _combine_checksum(data_without_checksum: bigint, len_words: int) -> bigint:
-    checksum = _calc_checksum(data_without_checksum, len_words)
+# data_without_checksum and data_bytes are the same data as bigint and as bytes; both are passed to avoid conversion.
+def _combine_checksum(data_without_checksum: bigint, data_bytes: bytes, len_words: int) -> bigint:
+    checksum = _calc_checksum(data_bytes, len_words)
     data = (data_without_checksum << CHECKSUM_LENGTHS[len_words]) | checksum
     return data
 
@@ -187,23 +240,29 @@ def noomnem_decode(words: list[str]) -> bytes:
         raise ValueError('unsupported number of words ' + str(len_words + 1))
 
     # check words are in vocabulary
-    ints = sorted([vocab.mnemonic_dict[w] for w in words])
-    # check for repetitions
-    for i in range(len(ints)-1):
-        if ints[i] == ints[i+1]:
-            raise ValueError('duplicate word at pos ' + str(i+1))
+    ints_set = {vocab.mnemonic_dict[w] for w in words}
+    # check for repetitions: repeated words collapse into one element of the set
+    if len(ints_set) != len_words:
+        # error path only: find the first word which is repeated to report it
+        seen = set()
+        for w in words:
+            if w in seen:
+                raise ValueError('duplicate word ' + w)
+            seen.add(w)
+    ints = sorted(ints_set)
 
     # decode from array of ints into one bigint
     result = scheme23_decode_ints(ints)
-    if log2(result) >= SUPPORTED_LENGTHS[len_words] + CHECKSUM_LENGTHS[len_words]:
+    if result.bit_length() > SUPPORTED_LENGTHS[len_words] + CHECKSUM_LENGTHS[len_words]:
         raise ValueError('decoded value is exceeding the limit')
 
     # extract, calculate and compare checksum
     result_without_checksum, checksum = _extract_checksum(result, len_words)
-    calculated = _calc_checksum(result_without_checksum, len_words)
+    data_bytes = result_without_checksum.to_bytes(SUPPORTED_LENGTHS[len_words] // 8, 'big')
+    calculated = _calc_checksum(data_bytes, len_words)
     if checksum != calculated:
         raise ValueError('checksum validation failed')
-    return result_without_checksum.to_bytes(SUPPORTED_LENGTHS[len_words] // 8, 'big')
+    return data_bytes
 
 
 def noomnem_encode(data: bytes) -> list[str]:
@@ -212,8 +271,8 @@ def noomnem_encode(data: bytes) -> list[str]:
     if len_words not in SUPPORTED_LENGTHS.keys():
         raise ValueError('unsupported number of words ' + str(len_words + 1))
     intdata = int.from_bytes(data, 'big')
-    assert log2(intdata) < SUPPORTED_LENGTHS[len_words]
-    data_with_checksum = _combine_checksum(intdata, len_words)
-    assert log2(data_with_checksum) < SUPPORTED_LENGTHS[len_words] + CHECKSUM_LENGTHS[len_words]
+    assert intdata.bit_length() <= SUPPORTED_LENGTHS[len_words]
+    data_with_checksum = _combine_checksum(intdata, data, len_words)
+    assert data_with_checksum.bit_length() <= SUPPORTED_LENGTHS[len_words] + CHECKSUM_LENGTHS[len_words]
     ints = scheme23_encode_ints(data_with_checksum, len_words)
     return [vocab.mnemonic[i] for i in ints]
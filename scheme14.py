@@ -18,10 +18,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import bisect
+import itertools
 import vocab
 from typing import Iterator
 
-from noomnem import combi, combi2, bigint
+from noomnem import combi_column, bigint
 
 # there are 2 schemes to encode (and decode) entropy into words.
 # i have named them after 3rd pick in a trivial case for 2 elements from a set of 5 integers.
@@ -46,7 +48,8 @@ def scheme14_decode_ints(elems: list[int], maximum: int = len(vocab.mnemonic)) -
     result, base = 0, 0
     for idx, elem in enumerate(elems):
         cur = elem - base
-        result += combi(curmax, count - idx) - combi(curmax - cur, count - idx)
+        column = combi_column(count - idx)
+        result += column[curmax] - column[curmax - cur]
         curmax -= cur + 1
         base = elem + 1
     return result
@@ -59,15 +62,17 @@ def scheme14_encode_ints(value: bigint, n: int, m: int) -> list[int]:
     base = 0
     curmax = n
     for left in range(m, 1, -1):
-        cur = 1
-        test = combi2(curmax, left) - combi2(curmax - cur, left)
-        while test <= value:
-            assert cur <= curmax - left
-            cur += 1
-            test = combi2(curmax, left) - combi2(curmax - cur, left)
+        # C(curmax, left) - C(curmax - cur, left) grows with cur, we need the smallest cur for which it exceeds value.
+        # that is the same as the largest curmax - cur for which C(curmax - cur, left) < C(curmax, left) - value.
+        # C(curmax, left) does not depend on cur, it is looked up once. pos is curmax - cur + 1.
+        column = combi_column(left)
+        total = column[curmax]
+        pos = bisect.bisect_left(column, total - value, 0, curmax)
+        cur = curmax - pos + 1
+        assert cur <= curmax - left + 1
 
         result.append(cur + base - 1)
-        value -= combi2(curmax, left) - combi2(curmax - cur + 1, left)
+        value -= total - column[pos]
         base += cur
         curmax -= cur
     # for last element we don't need a search
@@ -76,30 +81,7 @@ def scheme14_encode_ints(value: bigint, n: int, m: int) -> list[int]:
 
 
 # generates (yields) all possible options to pick m elements from a set of n elements.
+# scheme14 order is the lexicographic order of combinations, which is exactly what itertools.combinations produces.
 def scheme14_iterate(n: int, m: int) -> Iterator[list[int]]:
     assert n >= m
-    arr = [i for i in range(m)]
-    yield arr
-
-    while True:
-        idx = len(arr) - 1
-        limit = n
-        while idx >= 0:
-            nextval = arr[idx] + 1
-            if nextval < limit:
-                arr[idx] = nextval
-                break
-            idx -= 1
-            limit -= 1
-
-        if idx < 0:  # the end
-            break
-        nextval = arr[idx] + 1
-        idx += 1
-        while idx < len(arr):
-            arr[idx] = nextval
-            nextval += 1
-            idx += 1
-        assert nextval <= n
-
-        yield arr
+    return (list(c) for c in itertools.combinations(range(n), m))
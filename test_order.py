@@ -30,3 +30,9 @@ class TestOrdering(unittest.TestCase):
         random.shuffle(words)
         test = noomnem_decode(words)
         self.assertEqual(bytes(ba), test)
+
+    def test_duplicate_word(self):
+        words = noomnem_encode(bytearray(i for i in range(16)))
+        words[3] = words[7]
+        with self.assertRaisesRegex(ValueError, 'duplicate word ' + words[7]):
+            noomnem_decode(words)
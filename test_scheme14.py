@@ -24,6 +24,11 @@ class TestScheme14(unittest.TestCase):
     def test_25_4(self):
         self.do_test_n_m(25, 4)
 
+    def test_42_40(self):
+        # picks longer than the precalculated combi table (m > 37)
+        self.do_test_n_m(42, 40)
+        self.assertEqual(12345, scheme14_decode_ints(scheme14_encode_ints(12345, 100, 40), maximum=100))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -49,6 +49,21 @@ class TestScheme23(unittest.TestCase):
     def test_25_4(self):
         self.do_test_n_m(25, 4)
 
+    def test_42_40(self):
+        # picks longer than the precalculated combi table (m > 37)
+        self.do_test_n_m(42, 40)
+        self.assertEqual(12345, scheme23_decode_ints(scheme23_encode_ints(12345, 40)))
+
+    def test_empty_pick(self):
+        self.assertEqual([], scheme23_encode_ints(0, 0))
+        self.assertEqual(0, scheme23_decode_ints([]))
+
+    def test_value_too_large(self):
+        limit = scheme23_decode_ints(list(range(2048 - 16, 2048))) + 1  # C(2048, 16)
+        self.assertEqual(list(range(2048 - 16, 2048)), scheme23_encode_ints(limit - 1, 16))
+        with self.assertRaises(ValueError):
+            scheme23_encode_ints(limit, 16)
+
 
 if __name__ == '__main__':
     unittest.main()
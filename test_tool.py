@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(HERE, name)) as f:
+        return f.read().strip()
+
+
+def run_tool(stdin: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, os.path.join(HERE, 'tool.py')], input=stdin, capture_output=True,
+                          text=True, cwd=HERE)
+
+
+class TestTool(unittest.TestCase):
+    def test_single_line(self):
+        proc = run_tool(read_fixture('minimum-bip39.txt') + '\n')
+        self.assertEqual(0, proc.returncode)
+        self.assertEqual(read_fixture('minimum-noomnem.txt'), proc.stdout.strip())
+
+    def test_multiple_lines(self):
+        stdin = read_fixture('minimum-bip39.txt') + '\n\n' + read_fixture('maximum-noomnem.txt') + '\n'
+        proc = run_tool(stdin)
+        self.assertEqual(0, proc.returncode)
+        expected = [read_fixture('minimum-noomnem.txt'), read_fixture('maximum-bip39.txt')]
+        self.assertEqual(expected, proc.stdout.splitlines())
+
+    def test_invalid_line(self):
+        stdin = read_fixture('minimum-bip39.txt') + '\n' + 'abandon ability\n'
+        proc = run_tool(stdin)
+        self.assertEqual(1, proc.returncode)
+        self.assertEqual('', proc.stdout)
+        self.assertIn('line 2: unsupported number of words 2', proc.stderr)
+
+    def test_unknown_word(self):
+        proc = run_tool('abandon foo\n')
+        self.assertEqual(1, proc.returncode)
+        self.assertIn('line 1: word foo is not in vocabulary', proc.stderr)
+
+    def test_empty_input(self):
+        proc = run_tool('\n')
+        self.assertEqual(1, proc.returncode)
+        self.assertIn('no mnemonic on input', proc.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
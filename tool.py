@@ -21,6 +21,7 @@
 # The tool reads mnemonic from stdin and converts it between bip39 and noomnem, and prints the result.
 # For inputs with 12, 18, 24 words conversion is bip39 -> noomnem.
 # For inputs with 16, 26, 37 words conversion is noomnem -> bip39.
+# Several mnemonics can be converted in one run, one mnemonic per line; results are printed one per line.
 
 
 import sys
@@ -28,7 +29,7 @@ from typing import Union, List
 
 import vocab
 from noomnem import noomnem_encode, noomnem_decode
-from bip39 import bip39_encode, bip39_decode
+from bip39 import AppError, bip39_encode, bip39_decode
 
 
 def bip39_to_noomnem(words: Union[List[str], str]) -> str:
@@ -47,25 +48,37 @@ def noomnem_to_bip39(words: Union[List[str], str]) -> str:
     return outwords
 
 
-def main():
-    s = sys.stdin.read()
-    s = s.strip()
+# converts one mnemonic (words separated by spaces) and returns the result. raises ValueError on invalid input.
+def convert_line(s: str) -> str:
     words = s.split(' ')
     for w in words:
-        if w not in vocab.mnemonic:
-            print(f'word {w} is not in vocabulary')
-            sys.exit(1)
+        if w not in vocab.mnemonic_dict:  # dict lookup instead of scanning the list of 2048 words
+            raise ValueError(f'word {w} is not in vocabulary')
     if len(words) in (12, 18, 24):
-        outwords = bip39_to_noomnem(words)
+        return bip39_to_noomnem(words)
     elif len(words) in (16, 26, 37):
-        outwords = noomnem_to_bip39(words)
+        return noomnem_to_bip39(words)
     else:
-        sys.exit(1)
+        raise ValueError(f'unsupported number of words {len(words)}')
+
 
-    print(outwords)
+def main():
+    s = sys.stdin.read()
+    lines = [(num, line.strip()) for num, line in enumerate(s.splitlines(), 1) if line.strip()]  # skip blank lines
+    if not lines:
+        print('no mnemonic on input', file=sys.stderr)
+        sys.exit(1)
+    # all lines are converted before printing, so nothing is printed if any of them is invalid.
+    results = []
+    for num, line in lines:
+        try:
+            results.append(convert_line(line))
+        except (ValueError, AppError) as e:
+            print(f'line {num}: {e}', file=sys.stderr)
+            sys.exit(1)
+    print('\n'.join(results))
     sys.exit(0)
 
 
 if __name__ == '__main__':
     main()
-